@@ -1,42 +1,166 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache, partial
+from typing import NamedTuple
+from numba import njit, prange
+
+def _price_at(date_ns, prices, t):
+    i = int(np.searchsorted(date_ns, t))
+    
+    if date_ns[i] == t:
+        return float(prices[i])
+    
+    price_before = prices[i - 1]
+    price_after = prices[i]
+    
+    total_span = date_ns[i] - date_ns[i - 1]
+    span_to_target = t - date_ns[i - 1]
+    
+    calculated_price = price_before + (price_after - price_before) * (span_to_target / total_span)
+    return float(calculated_price)
+
+@njit(cache=True, fastmath=True)
+def _eval_kernel(storage_days, buy, sell, trade_volume, storage_rate):
+    n = len(storage_days)
+    purchase_cost = np.empty(n)
+    sales_income = np.empty(n)
+    storage_fee = np.empty(n)
+    net_flow = np.empty(n)
+    unit_profit = np.empty(n)
+    
+    unit_fee_per_day = storage_rate / 365.0
+    fee_per_day = unit_fee_per_day * trade_volume
+    
+    for i in range(n):
+        purchase_cost[i] = trade_volume * buy[i]
+        sales_income[i] = trade_volume * sell[i]
+        storage_fee[i] = fee_per_day * storage_days[i]
+        net_flow[i] = sales_income[i] - purchase_cost[i] - storage_fee[i]
+        unit_profit[i] = sell[i] - buy[i] - unit_fee_per_day * storage_days[i]
+    
+    return purchase_cost, sales_income, storage_fee, net_flow, unit_profit
+
+@njit(parallel=True, cache=True)
+def _eval_batch_kernel(storage_days, buy, sell, trade_volume, storage_rate):
+    num_contracts, num_ops = storage_days.shape
+    final_value = np.empty(num_contracts)
+    
+    for c in prange(num_contracts):
+        fee_per_day = storage_rate[c] / 365.0 * trade_volume[c]
+        total = 0.0
+        for i in range(num_ops):
+            total += trade_volume[c] * (sell[c, i] - buy[c, i]) - fee_per_day * storage_days[c, i]
+        final_value[c] = total
+    
+    return final_value
+
+class OpResult(NamedTuple):
+    id: int
+    inject_date: date
+    withdraw_date: date
+    buy_price: float
+    sell_price: float
+    purchase_cost: float
+    sales_income: float
+    storage_fee: float
+    net_flow: float
+    unit_profit: float
+
+@dataclass
+class ContractOperations:
+    inject_date: np.ndarray
+    withdraw_date: np.ndarray
+    buy_price: np.ndarray
+    sell_price: np.ndarray
+    purchase_cost: np.ndarray
+    sales_income: np.ndarray
+    storage_fee: np.ndarray
+    net_flow: np.ndarray
+    unit_profit: np.ndarray
+    
+    def __len__(self):
+        return len(self.inject_date)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.operation(i)
+    
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"Operation index {i} out of range for {len(self)} operations")
+        return self.operation(i)
+    
+    def operation(self, i):
+        return OpResult(
+            i + 1,
+            self.inject_date[i].item(),
+            self.withdraw_date[i].item(),
+            float(self.buy_price[i]),
+            float(self.sell_price[i]),
+            float(self.purchase_cost[i]),
+            float(self.sales_income[i]),
+            float(self.storage_fee[i]),
+            float(self.net_flow[i]),
+            float(self.unit_profit[i])
+        )
+    
+    def to_frame(self):
+        return pd.DataFrame({
+            'inject_date': self.inject_date,
+            'withdraw_date': self.withdraw_date,
+            'buy_price': self.buy_price,
+            'sell_price': self.sell_price,
+            'purchase_cost': self.purchase_cost,
+            'sales_income': self.sales_income,
+            'storage_fee': self.storage_fee,
+            'net_flow': self.net_flow,
+            'unit_profit': self.unit_profit
+        }, index=pd.RangeIndex(1, len(self) + 1, name='id'))
 
 class GasStorageCalculator:
     def __init__(self, data_file="Nat_Gas.csv"):
-        self.market_data = self.load_market_prices(data_file)
+        self._date_ns, self._prices = self.load_market_prices(data_file)
+        self._date_ns.flags.writeable = False
+        self._prices.flags.writeable = False
+        self._cached_price_at = lru_cache(maxsize=4096)(partial(_price_at, self._date_ns, self._prices))
+    
+    @property
+    def market_data(self):
+        return pd.DataFrame({'Prices': self._prices}, index=pd.DatetimeIndex(self._date_ns.view('datetime64[ns]'), name='Dates'))
     
     def load_market_prices(self, path):
-        df = pd.read_csv(path)
-        df['Dates'] = pd.to_datetime(df['Dates'], format='%m/%d/%y')
-        df['Prices'] = pd.to_numeric(df['Prices'], errors='coerce')
-        df = df.dropna()
-        return df.set_index('Dates')
+        df = pd.read_csv(path, parse_dates=['Dates'], date_format='%m/%d/%y', dtype={'Prices': 'float64'})
+        df = df.dropna().sort_values('Dates')
+        date_ns = df['Dates'].to_numpy().astype('datetime64[ns]').view('i8')
+        prices = df['Prices'].to_numpy(float)
+        return date_ns, prices
     
     def find_price(self, target_date):
-        if target_date in self.market_data.index:
-            return float(self.market_data.loc[target_date, 'Prices'])
-        
-        before_dates = self.market_data[self.market_data.index <= target_date]
-        after_dates = self.market_data[self.market_data.index >= target_date]
+        t = int(np.datetime64(target_date, 'D').astype('datetime64[ns]').astype('int64'))
         
-        if len(before_dates) == 0 or len(after_dates) == 0:
+        if t < self._date_ns[0] or t > self._date_ns[-1]:
             raise ValueError(f"No price data near {target_date}")
         
-        date_before = before_dates.index.max()
-        date_after = after_dates.index.min()
-        
-        price_before = float(self.market_data.loc[date_before, 'Prices'])
-        price_after = float(self.market_data.loc[date_after, 'Prices'])
+        return self._cached_price_at(t)
+    
+    def find_prices(self, dates):
+        targets = np.asarray(dates, dtype='datetime64[D]').astype('datetime64[ns]').view('i8')
         
-        total_days = (date_after - date_before).days
-        days_to_target = (target_date - date_before).days
+        out_of_range = (targets < self._date_ns[0]) | (targets > self._date_ns[-1])
+        if out_of_range.any():
+            raise ValueError(f"No price data near {np.asarray(dates)[out_of_range][0]}")
         
-        if total_days == 0:
-            return price_before
+        idx = np.clip(np.searchsorted(self._date_ns, targets), 1, len(self._date_ns) - 1)
+        lo = idx - 1
+        hi = idx
         
-        calculated_price = price_before + (price_after - price_before) * (days_to_target / total_days)
-        return calculated_price
+        total_span = self._date_ns[hi] - self._date_ns[lo]
+        frac = np.where(total_span == 0, 0.0, (targets - self._date_ns[lo]) / np.where(total_span == 0, 1, total_span))
+        return self._prices[lo] + frac * (self._prices[hi] - self._prices[lo])
     
     def compute_storage_fee(self, days_stored, capacity, annual_rate):
         return annual_rate * capacity * (days_stored / 365.0)
@@ -55,43 +179,28 @@ class GasStorageCalculator:
         if trade_volume is None:
             trade_volume = max_cap
         
-        if buy_prices is None:
-            buy_prices = [self.find_price(date) for date in inject_dates]
+        inject_days = np.array(inject_dates, dtype='datetime64[D]')
+        withdraw_days = np.array(withdraw_dates, dtype='datetime64[D]')
+        buy = self.find_prices(inject_days) if buy_prices is None else np.asarray(buy_prices, dtype=float)
+        sell = self.find_prices(withdraw_days) if sell_prices is None else np.asarray(sell_prices, dtype=float)
         
-        if sell_prices is None:
-            sell_prices = [self.find_price(date) for date in withdraw_dates]
-        
-        total_buy_cost = 0
-        total_sell_income = 0
-        total_storage_fee = 0
-        operation_results = []
-        
-        for i, (inject_day, withdraw_day, buy_price, sell_price) in enumerate(zip(inject_dates, withdraw_dates, buy_prices, sell_prices)):
-            purchase_cost = trade_volume * buy_price
-            sales_income = trade_volume * sell_price
-            
-            storage_days = (withdraw_day - inject_day).days
-            storage_fee = self.compute_storage_fee(storage_days, trade_volume, storage_rate)
-            
-            total_buy_cost += purchase_cost
-            total_sell_income += sales_income
-            total_storage_fee += storage_fee
-            
-            net_flow = sales_income - purchase_cost - storage_fee
-            unit_profit = sell_price - buy_price - (storage_fee / trade_volume)
-            
-            operation_results.append({
-                'id': i + 1,
-                'inject_date': inject_day,
-                'withdraw_date': withdraw_day,
-                'buy_price': buy_price,
-                'sell_price': sell_price,
-                'purchase_cost': purchase_cost,
-                'sales_income': sales_income,
-                'storage_fee': storage_fee,
-                'net_flow': net_flow,
-                'unit_profit': unit_profit
-            })
+        if not len(inject_days) == len(withdraw_days) == len(buy) == len(sell):
+            raise ValueError(
+                f"Mismatched operation lengths: {len(inject_days)} inject dates, {len(withdraw_days)} withdraw dates, "
+                f"{len(buy)} buy prices, {len(sell)} sell prices")
+        
+        storage_days = (withdraw_days - inject_days).astype(np.int64)
+        
+        purchase_cost, sales_income, storage_fee, net_flow, unit_profit = _eval_kernel(
+            storage_days, buy, sell, float(trade_volume), float(storage_rate))
+        
+        total_buy_cost = float(purchase_cost.sum())
+        total_sell_income = float(sales_income.sum())
+        total_storage_fee = float(storage_fee.sum())
+        
+        operation_results = ContractOperations(
+            inject_days, withdraw_days, buy, sell, purchase_cost,
+            sales_income, storage_fee, net_flow, unit_profit)
         
         final_value = total_sell_income - total_buy_cost - total_storage_fee
         avg_unit_profit = final_value / (len(inject_dates) * trade_volume) if len(inject_dates) > 0 else 0
@@ -105,6 +214,45 @@ class GasStorageCalculator:
             'operation_count': len(inject_dates),
             'operations': operation_results
         }
+    
+    def evaluate_batch(self,
+                       inject_dates,
+                       withdraw_dates,
+                       buy_prices=None,
+                       sell_prices=None,
+                       storage_rates=0.1,
+                       trade_volumes=10000):
+        
+        inject_days = np.asarray(inject_dates, dtype='datetime64[D]')
+        withdraw_days = np.asarray(withdraw_dates, dtype='datetime64[D]')
+        
+        if inject_days.ndim != 2:
+            raise ValueError(f"Expected 2-D (contract x operation) dates, got {inject_days.ndim}-D")
+        
+        if withdraw_days.shape != inject_days.shape:
+            raise ValueError(f"Withdraw dates shape {withdraw_days.shape} does not match inject dates shape {inject_days.shape}")
+        
+        num_contracts = inject_days.shape[0]
+        
+        if buy_prices is None:
+            buy = self.find_prices(inject_days.ravel()).reshape(inject_days.shape)
+        else:
+            buy = np.asarray(buy_prices, dtype=float)
+        
+        if sell_prices is None:
+            sell = self.find_prices(withdraw_days.ravel()).reshape(withdraw_days.shape)
+        else:
+            sell = np.asarray(sell_prices, dtype=float)
+        
+        if buy.shape != inject_days.shape or sell.shape != inject_days.shape:
+            raise ValueError(
+                f"Price shapes buy={buy.shape}, sell={sell.shape} do not match dates shape {inject_days.shape}")
+        
+        storage_days = (withdraw_days - inject_days).astype(np.int64)
+        volumes = np.broadcast_to(np.asarray(trade_volumes, dtype=float), (num_contracts,)).copy()
+        rates = np.broadcast_to(np.asarray(storage_rates, dtype=float), (num_contracts,)).copy()
+        
+        return _eval_batch_kernel(storage_days, buy, sell, volumes, rates)
 
 def run_examples():
     calculator = GasStorageCalculator("Nat_Gas.csv")
@@ -174,18 +322,20 @@ def run_examples():
     )
     
     print(f"Contract Value: ${result3['final_value']:,.2f}")
-    print(f"Unit Profit: ${result3['operations'][0]['unit_profit']:.2f}")
+    print(f"Unit Profit: ${result3['operations'].unit_profit[0]:.2f}")
     print()
     
     print("Detailed Results for Example 1:")
-    for op in result1['operations']:
-        print(f"Trade {op['id']}:")
-        print(f"  Buy: {op['inject_date'].strftime('%Y-%m-%d')} @ ${op['buy_price']:.2f}")
-        print(f"  Sell: {op['withdraw_date'].strftime('%Y-%m-%d')} @ ${op['sell_price']:.2f}")
-        print(f"  Storage: ${op['storage_fee']:,.2f}")
-        print(f"  Net: ${op['net_flow']:,.2f}")
-        print(f"  Unit Gain: ${op['unit_profit']:.2f}")
-        print()
+    print(result1['operations'].to_frame().to_string(formatters={
+        'buy_price': '${:.2f}'.format,
+        'sell_price': '${:.2f}'.format,
+        'purchase_cost': '${:,.2f}'.format,
+        'sales_income': '${:,.2f}'.format,
+        'storage_fee': '${:,.2f}'.format,
+        'net_flow': '${:,.2f}'.format,
+        'unit_profit': '${:.2f}'.format
+    }))
+    print()
 
 if __name__ == "__main__":
     run_examples()
\ No newline at end of file
@@ -1,50 +1,132 @@
+import os
+import joblib
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.ensemble import HistGradientBoostingClassifier
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import accuracy_score, classification_report
 
-data = pd.read_csv('Task 3 and 4_Loan_Data.csv')
+DATA_PATH = 'Task 3 and 4_Loan_Data.csv'
+MODEL_PARAMS = {'max_iter': 200, 'learning_rate': 0.05, 'random_state': 42}
 
-X = data.drop(['customer_id', 'default'], axis=1)
-y = data['default']
+def model_path_for(data_path):
+    return os.path.splitext(data_path)[0] + '_model.joblib'
 
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+MODEL_PATH = model_path_for(DATA_PATH)
 
-scaler = StandardScaler()
-X_train_scaled = scaler.fit_transform(X_train)
-X_test_scaled = scaler.transform(X_test)
+def load_data(path=DATA_PATH):
+    data = pd.read_csv(path, dtype={
+        'credit_lines_outstanding': 'float32',
+        'loan_amt_outstanding': 'float32',
+        'total_debt_outstanding': 'float32',
+        'income': 'float32',
+        'years_employed': 'float32',
+        'fico_score': 'float32',
+        'default': 'int8'
+    })
 
-rf_model = RandomForestClassifier(n_estimators=100, random_state=42)
-rf_model.fit(X_train_scaled, y_train)
+    X = data.drop(['customer_id', 'default'], axis=1)
+    y = data['default']
+
+    return train_test_split(X, y, test_size=0.2, random_state=42)
+
+class Classifier:
+    def __init__(self, model_path=None, data_path=DATA_PATH):
+        self.model_path = model_path if model_path is not None else model_path_for(data_path)
+        self.data_path = data_path
+        self._model = None
+        self._test_split = None
+
+    @property
+    def model(self):
+        if self._model is None:
+            try:
+                self.load()
+            except (FileNotFoundError, ValueError):
+                self.fit()
+        return self._model
+
+    @property
+    def test_split(self):
+        if self._test_split is None:
+            X_train, X_test, y_train, y_test = load_data(self.data_path)
+            self._test_split = (X_test, y_test)
+        return self._test_split
+
+    def load(self):
+        artifact = joblib.load(self.model_path)
+        if not self._artifact_matches(artifact):
+            raise ValueError(f"{self.model_path} was not trained on {self.data_path} with the current parameters")
+        self._model = artifact['model']
+        return self
+
+    def fit(self):
+        X_train, X_test, y_train, y_test = load_data(self.data_path)
+        model = HistGradientBoostingClassifier(**MODEL_PARAMS)
+        model.fit(X_train.to_numpy(), y_train)
+        artifact = {
+            'model': model,
+            'data_path': os.path.abspath(self.data_path),
+            'params': MODEL_PARAMS
+        }
+        joblib.dump(artifact, self.model_path, compress=3)
+        self._model = model
+        self._test_split = (X_test, y_test)
+        return self
+
+    def _artifact_matches(self, artifact):
+        return (isinstance(artifact, dict)
+                and artifact.get('data_path') == os.path.abspath(self.data_path)
+                and artifact.get('params') == MODEL_PARAMS)
+
+    def predict_default_probability(self, loan_features):
+        model = self.model
+        if np.shape(loan_features) != (model.n_features_in_,):
+            raise ValueError(f"Expected {model.n_features_in_} loan features, got shape {np.shape(loan_features)}")
+        features_array = np.asarray(loan_features, dtype=np.float32).reshape(1, -1)
+        default_prob = model.predict_proba(features_array)[0, 1]
+        return default_prob
+
+    def predict_default_probabilities(self, feature_matrix):
+        features_array = np.asarray(feature_matrix, dtype=np.float32)
+        return self.model.predict_proba(features_array)[:, 1]
+
+def train(model_path=None, data_path=DATA_PATH):
+    return Classifier(model_path, data_path).fit()
+
+def load(model_path=None, data_path=DATA_PATH):
+    return Classifier(model_path, data_path).load()
+
+default_classifier = Classifier()
 
 def predict_default_probability(loan_features):
-    features_array = np.array(loan_features).reshape(1, -1)
-    features_scaled = scaler.transform(features_array)
-    default_prob = rf_model.predict_proba(features_scaled)[0][1]
-    return default_prob
+    return default_classifier.predict_default_probability(loan_features)
+
+def predict_default_probabilities(feature_matrix):
+    return default_classifier.predict_default_probabilities(feature_matrix)
 
 def calculate_expected_loss(loan_features, loan_amount, recovery_rate=0.1):
     pd_value = predict_default_probability(loan_features)
     expected_loss = pd_value * loan_amount * (1 - recovery_rate)
     return expected_loss
 
+def main():
+    print("=== Loan Default Prediction ===")
 
+    sample_features = [50000, 2.5, 650, 1, 0, 28]  # Example features
+    loan_amount = 10000
 
-print("=== Loan Default Prediction ===")
-
-sample_features = [50000, 2.5, 650, 1, 0, 28]  # Example features
-loan_amount = 10000
-
+    prob_default = predict_default_probability(sample_features)
+    expected_loss = calculate_expected_loss(sample_features, loan_amount)
 
-prob_default = predict_default_probability(sample_features)
-expected_loss = calculate_expected_loss(sample_features, loan_amount)
+    print(f"Probability of Default: {prob_default:.2%}")
+    print(f"Expected Loss: ${expected_loss:.2f}")
+    print(f"Loan Amount: ${loan_amount:,.2f}")
 
-print(f"Probability of Default: {prob_default:.2%}")
-print(f"Expected Loss: ${expected_loss:.2f}")
-print(f"Loan Amount: ${loan_amount:,.2f}")
+    X_test, y_test = default_classifier.test_split
+    y_pred = default_classifier.model.predict(X_test.to_numpy())
+    accuracy = accuracy_score(y_test, y_pred)
+    print(f"\nModel Accuracy: {accuracy:.2%}")
 
-y_pred = rf_model.predict(X_test_scaled)
-accuracy = accuracy_score(y_test, y_pred)
-print(f"\nModel Accuracy: {accuracy:.2%}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
\ No newline at end of file